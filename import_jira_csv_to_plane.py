@@ -4,7 +4,7 @@
 Import Jira CSV into a Plane (self-hosted) Community Edition project using the public REST API.
 
 Requirements:
-    pip install requests python-dotenv
+    pip install requests "httpx[http2]" aiolimiter orjson python-dotenv
 
 Usage:
     1) Copy plane_import.env.example to .env and fill in values
@@ -16,17 +16,37 @@ Notes:
     - The script maps basic fields: Summary -> name, Description -> description.
     - Optional: Labels, Status, Priority. Unknown or missing fields are skipped safely.
     - Labels and States are created in Plane if missing (opt-out with flags).
+    - Issues are created concurrently over one HTTP/2 httpx client, multiplexed on a single
+      connection where the server supports it (tune with --concurrency).
+    - Issue creates are throttled with --max-rps and retried with backoff on 429/503.
+    - Project, label and state lookups are cached on disk (--cache-file) for 24h so re-runs
+      skip the startup GETs; pass --refresh-cache to ignore the cache.
+    - Each created issue is appended to a checkpoint file (default <csv>.checkpoint.jsonl);
+      re-running against the same workspace and project skips rows already recorded there,
+      keyed by Jira "Issue key" (or row number).
 
 Tested against Plane API docs (Add issue, List/Create labels, List/Create states).
 """
 import argparse
+import asyncio
 import csv
+import functools
+import itertools
+import json
+import math
 import os
+import re
 import sys
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, MutableMapping, Optional, Tuple
+import httpx
+import orjson
 import requests
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # --------------------------
 # Config & helpers
@@ -46,49 +66,142 @@ def plane_headers(api_key: str) -> Dict[str, str]:
         "Accept": "application/json",
     }
 
+def make_session() -> requests.Session:
+    """Shared keep-alive session so sync lookups reuse one pooled connection instead of a new TCP/TLS handshake each."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=64,
+        max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+SESSION = make_session()
+
+def check_redirect(method: str, url: str, status: int, resp_headers) -> None:
+    """Redirects are not followed (each costs a round trip); surface them so PLANE_BASE_URL can be fixed."""
+    if 300 <= status < 400:
+        raise RuntimeError(
+            f"{method} {url} -> {status} redirect to {resp_headers.get('Location')!r}; "
+            f"point PLANE_BASE_URL at the final host/scheme so no redirect is needed"
+        )
+
 def get(url: str, headers: Dict[str, str]):
-    r = requests.get(url, headers=headers, timeout=30, allow_redirects=True)
+    r = SESSION.get(url, headers=headers, timeout=30, allow_redirects=False)
+    check_redirect("GET", url, r.status_code, r.headers)
     ctype = r.headers.get('Content-Type', '')
     if r.status_code >= 400:
         raise RuntimeError(f"GET {url} -> {r.status_code} {r.text[:200]}")
     try:
         if 'application/json' not in ctype:
             raise ValueError(f"Non-JSON response (Content-Type={ctype}). First bytes: {r.text[:120]}")
-        return r.json()
+        return orjson.loads(r.content)
     except Exception as e:
         raise RuntimeError(f"GET {url} -> {r.status_code}; JSON parse error: {e}; First bytes: {r.text[:120]}")
 
-def post(url: str, headers: Dict[str, str], json: dict):
-    r = requests.post(url, headers=headers, json=json, timeout=30)
-    ctype = r.headers.get('Content-Type', '')
-    if r.status_code >= 400:
-        raise RuntimeError(f"POST {url} -> {r.status_code} {r.text[:200]}")
-    try:
-        if 'application/json' not in ctype:
-            raise ValueError(f"Non-JSON response (Content-Type={ctype}). First bytes: {r.text[:120]}")
-        return r.json()
-    except Exception as e:
-        raise RuntimeError(f"POST {url} -> {r.status_code}; JSON parse error: {e}; First bytes: {r.text[:120]}")
+# Only statuses where the server rejected the request before doing any work. A 500/502/504 on a
+# create may arrive after the insert committed, and retrying it would duplicate the object.
+RETRY_STATUSES = {429, 503}
+MAX_ATTEMPTS = 5
+MAX_BACKOFF = 60.0
+
+def retry_delay(resp_headers, attempt: int) -> float:
+    """Seconds to wait before retrying: honor Retry-After / X-RateLimit-Reset, else exponential backoff."""
+    retry_after = resp_headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_BACKOFF)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    reset = resp_headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            reset_val = float(reset)
+            # Either an epoch timestamp or a relative number of seconds
+            delay = reset_val - time.time() if reset_val > 1e9 else reset_val
+            return min(max(delay, 0.0), MAX_BACKOFF)
+        except ValueError:
+            pass
+    return min(0.5 * (2 ** attempt), MAX_BACKOFF)
+
+async def post_async(client: httpx.AsyncClient, url: str, json: dict, limiter: Optional[AsyncLimiter] = None):
+    # Serialize once with orjson (reused across retries); the client already sends Content-Type: application/json
+    body = orjson.dumps(json)
+    for attempt in range(MAX_ATTEMPTS):
+        if limiter is not None:
+            await limiter.acquire()
+        r = await client.post(url, content=body)
+        ctype = r.headers.get('Content-Type', '')
+        if r.status_code in RETRY_STATUSES and attempt < MAX_ATTEMPTS - 1:
+            delay = retry_delay(r.headers, attempt)
+            print(f"[RETRY] POST {url} -> {r.status_code}; sleeping {delay:.1f}s (attempt {attempt + 1}/{MAX_ATTEMPTS})", file=sys.stderr)
+            await asyncio.sleep(delay)
+            continue
+        check_redirect("POST", url, r.status_code, r.headers)
+        if r.status_code >= 400:
+            raise RuntimeError(f"POST {url} -> {r.status_code} {r.text[:200]}")
+        try:
+            if 'application/json' not in ctype:
+                raise ValueError(f"Non-JSON response (Content-Type={ctype}). First bytes: {r.text[:120]}")
+            return orjson.loads(r.content)
+        except Exception as e:
+            raise RuntimeError(f"POST {url} -> {r.status_code}; JSON parse error: {e}; First bytes: {r.text[:120]}")
 
 # --------------------------
 # Plane lookups
 # --------------------------
 
-def list_labels(base_url: str, ws_slug: str, project_id: str, headers: Dict[str,str]) -> Dict[str, dict]:
+class CaseInsensitiveIndex(MutableMapping):
+    """Lowercased-name -> item mapping over an API listing.
+
+    Keys are only normalized on first access, and listing() hands back the raw items until then,
+    so a listing the import never consults (e.g. labels for a CSV without a Labels column) is
+    never normalized, not even when it is written to the disk cache.
+    """
+
+    def __init__(self, items: List[dict]):
+        self._items = items
+        self._by_name: Optional[Dict[str, dict]] = None
+
+    def _index(self) -> Dict[str, dict]:
+        if self._by_name is None:
+            self._by_name = {(item.get("name") or "").strip().lower(): item for item in self._items}
+            self._items = []
+        return self._by_name
+
+    def mapping(self) -> Dict[str, dict]:
+        """The underlying lowercased-name dict, built on first use; alias its get() in hot loops."""
+        return self._index()
+
+    def listing(self) -> List[dict]:
+        """The items as a plain list, for persisting; does not build the index."""
+        return self._items if self._by_name is None else list(self._by_name.values())
+
+    def get(self, key, default=None):
+        return self._index().get(key, default)
+
+    def __getitem__(self, key: str) -> dict:
+        return self._index()[key]
+
+    def __setitem__(self, key: str, value: dict) -> None:
+        self._index()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._index()[key]
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+def list_labels(base_url: str, ws_slug: str, project_id: str, headers: Dict[str,str]) -> CaseInsensitiveIndex:
     url = f"{base_url}/api/v1/workspaces/{ws_slug}/projects/{project_id}/labels/"
     data = get(url, headers)
     # normalize by case-insensitive name
-    return { (item.get("name") or "").strip().lower(): item for item in data.get("results", data) }
-
-def ensure_label(base_url: str, ws_slug: str, project_id: str, headers: Dict[str,str], name: str) -> dict:
-    existing = list_labels(base_url, ws_slug, project_id, headers)
-    key = (name or "").strip().lower()
-    if key in existing:
-        return existing[key]
-    # create
-    url = f"{base_url}/api/v1/workspaces/{ws_slug}/projects/{project_id}/labels/"
-    created = post(url, headers, {"name": name})
-    return created
+    return CaseInsensitiveIndex(data.get("results", data))
 
 
 def infer_state_group(state_name: str) -> str:
@@ -104,39 +217,148 @@ def infer_state_group(state_name: str) -> str:
     return 'backlog'
 
 
-def list_states(base_url: str, ws_slug: str, project_id: str, headers: Dict[str,str]) -> Dict[str, dict]:
+def list_states(base_url: str, ws_slug: str, project_id: str, headers: Dict[str,str]) -> CaseInsensitiveIndex:
     url = f"{base_url}/api/v1/workspaces/{ws_slug}/projects/{project_id}/states/"
     data = get(url, headers)
-    return { (item.get("name") or "").strip().lower(): item for item in data.get("results", data) }
+    return CaseInsensitiveIndex(data.get("results", data))
+
+async def ensure_label_async(client: httpx.AsyncClient, base_url: str, ws_slug: str, project_id: str,
+                             name: str, cache: MutableMapping[str, dict], limiter: Optional[AsyncLimiter] = None) -> dict:
+    """Return the label named `name` from `cache` (as built by list_labels), creating it and caching it if missing."""
+    key = (name or "").strip().lower()
+    hit = cache.get(key)
+    if hit:
+        return hit
+    url = f"{base_url}/api/v1/workspaces/{ws_slug}/projects/{project_id}/labels/"
+    created = await post_async(client, url, {"name": name}, limiter)
+    cache[key] = created
+    return created
 
-def ensure_state(base_url: str, ws_slug: str, project_id: str, headers: Dict[str,str], name: str) -> dict:
-    existing = list_states(base_url, ws_slug, project_id, headers)
+async def ensure_state_async(client: httpx.AsyncClient, base_url: str, ws_slug: str, project_id: str,
+                             name: str, cache: MutableMapping[str, dict], limiter: Optional[AsyncLimiter] = None) -> dict:
+    """Return the state named `name` from `cache` (as built by list_states), creating it and caching it if missing."""
     key = (name or "").strip().lower()
-    if key in existing:
-        return existing[key]
+    hit = cache.get(key)
+    if hit:
+        return hit
     url = f"{base_url}/api/v1/workspaces/{ws_slug}/projects/{project_id}/states/"
     # Try minimal payload with default neutral color
     payload = {"name": name, "color": "#9ca3af"}
     try:
-        return post(url, headers, payload)
-    except Exception as e:
+        created = await post_async(client, url, payload, limiter)
+    except Exception:
         # If server requires a group, retry with inferred group
-        grp = infer_state_group(name)
-        payload["group"] = grp
-        try:
-            return post(url, headers, payload)
-        except Exception as e2:
-            raise
+        payload["group"] = infer_state_group(name)
+        created = await post_async(client, url, payload, limiter)
+    cache[key] = created
+    return created
 
-def create_issue(base_url: str, ws_slug: str, project_id: str, headers: Dict[str,str], payload: dict) -> dict:
-    url = f"{base_url}/api/v1/workspaces/{ws_slug}/projects/{project_id}/issues/"
-    return post(url, headers, payload)
+def issues_url(base_url: str, ws_slug: str, project_id: str) -> str:
+    return f"{base_url}/api/v1/workspaces/{ws_slug}/projects/{project_id}/issues/"
+
+async def create_issue_async(client: httpx.AsyncClient, url: str, payload: dict,
+                             limiter: Optional[AsyncLimiter] = None) -> dict:
+    return await post_async(client, url, payload, limiter)
+
+# --------------------------
+# On-disk lookup cache
+# --------------------------
+
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".plane_import_cache.json")
+CACHE_TTL_SECONDS = 24 * 3600
+
+def load_disk_cache(path: str) -> Dict[str, Any]:
+    """Load the JSON lookup cache; a missing or unreadable file yields an empty cache."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_disk_cache(path: str, data: Dict[str, Any]) -> None:
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[WARN] Could not write cache file {path}: {e}", file=sys.stderr)
+
+def cache_get(data: Dict[str, Any], section: str, key: str) -> Optional[Tuple[Any, float]]:
+    """Return (value, fetched_at) for a fresh entry, or None if absent or older than CACHE_TTL_SECONDS."""
+    entry = data.get(section, {}).get(key)
+    if not entry or time.time() - entry.get("ts", 0) > CACHE_TTL_SECONDS:
+        return None
+    return entry["value"], entry["ts"]
+
+def cache_put(data: Dict[str, Any], section: str, key: str, value: Any, ts: Optional[float] = None) -> None:
+    data.setdefault(section, {})[key] = {"ts": time.time() if ts is None else ts, "value": value}
+
+class ProjectLookups:
+    """A project's label and state caches, loaded from and written through to the on-disk cache.
+
+    A listing read from disk can miss objects created after it was saved (e.g. by an interrupted
+    run), so refresh() re-lists it once before anything is created.
+    """
+
+    def __init__(self, path: str, disk_cache: Dict[str, Any], base_url: str, ws_slug: str,
+                 project_id: str, headers: Dict[str,str], refresh: bool = False):
+        self._path = path
+        self._disk = disk_cache
+        self._key = f"{base_url}|{ws_slug}|{project_id}"
+        self._fetch = {
+            "labels": lambda: list_labels(base_url, ws_slug, project_id, headers),
+            "states": lambda: list_states(base_url, ws_slug, project_id, headers),
+        }
+        self._caches: Dict[str, CaseInsensitiveIndex] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._from_disk: Dict[str, bool] = {}
+        for section in self._fetch:
+            cached = None if refresh else cache_get(disk_cache, section, self._key)
+            if cached:
+                items = cached[0]
+                # Older caches stored the name-keyed mapping rather than the listing
+                if isinstance(items, dict):
+                    items = list(items.values())
+                self._caches[section] = CaseInsensitiveIndex(items)
+                self._fetched_at[section] = cached[1]
+                self._from_disk[section] = True
+            else:
+                self._caches[section] = self._fetch[section]()
+                self._fetched_at[section] = time.time()
+                self._from_disk[section] = False
+
+    @property
+    def labels(self) -> MutableMapping[str, dict]:
+        return self._caches["labels"]
+
+    @property
+    def states(self) -> MutableMapping[str, dict]:
+        return self._caches["states"]
+
+    def refresh(self, section: str) -> bool:
+        """Re-list `section` in place if it came from disk; returns whether a refetch happened."""
+        if not self._from_disk[section]:
+            return False
+        self._caches[section].update(self._fetch[section]())
+        self._fetched_at[section] = time.time()
+        self._from_disk[section] = False
+        return True
+
+    def save(self) -> None:
+        # Keep the last fetch time, not the save time, so the TTL still expires
+        for section, cache in self._caches.items():
+            cache_put(self._disk, section, self._key, cache.listing(), self._fetched_at[section])
+        save_disk_cache(self._path, self._disk)
 
 # --------------------------
 # CSV parsing and mapping
 # --------------------------
 
 DEFAULT_LABEL_SEP = ";"
+DEFAULT_BATCH_SIZE = 50_000
+ISSUE_QUEUE_SIZE = 1000
 
 # Conservative priority mapping; adjust per your Plane setup.
 DEFAULT_PRIORITY_MAP = {
@@ -157,48 +379,350 @@ DEFAULT_STATUS_TO_STATE = {
     "Closed": "Completed",
 }
 
-def map_priority(jira_priority: str) -> Optional[str]:
-    if not jira_priority:
-        return None
-    return DEFAULT_PRIORITY_MAP.get(jira_priority.strip(), None)
-
-def map_state(jira_status: str) -> Optional[str]:
-    if not jira_status:
-        return None
-    return DEFAULT_STATUS_TO_STATE.get(jira_status.strip(), None)
+# Bound lookups used per row by build_payload, saving a wrapper call and attribute lookup each time
+_priority_get = DEFAULT_PRIORITY_MAP.get
+_state_get = DEFAULT_STATUS_TO_STATE.get
 
 def parse_labels(raw: str, sep: str = DEFAULT_LABEL_SEP) -> List[str]:
     if not raw:
         return []
+    # Fast path: most rows carry at most one label
+    if sep not in raw and "," not in raw:
+        s = raw.strip()
+        return [s] if s else []
     parts = [p.strip() for p in raw.replace(",", sep).split(sep)]
     return [p for p in parts if p]
 
+# Columns read from the export; lowercase header spellings are accepted as a fallback.
+CSV_COLUMNS = ("Summary", "Description", "Labels", "Status", "Priority", "Issue key")
+
+def csv_column_indices(header: List[str]) -> Dict[str, Optional[int]]:
+    """Map each known column (lowercased) to its index in `header`, or None if absent. First occurrence wins."""
+    idx: Dict[str, Optional[int]] = {}
+    for col in CSV_COLUMNS:
+        for candidate in (col, col.lower()):
+            if candidate in header:
+                idx[col.lower()] = header.index(candidate)
+                break
+        else:
+            idx[col.lower()] = None
+    return idx
+
+def read_csv_header(path: str, delimiter: str) -> List[str]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f, delimiter=delimiter), [])
+
+def iter_csv_batches(path: str, delimiter: str, batch_size: int) -> Iterator[List[List[str]]]:
+    """Stream data rows (header skipped) in lists of up to `batch_size`, never loading the whole file."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        next(reader, None)
+        while True:
+            batch = list(itertools.islice(reader, batch_size))
+            if not batch:
+                return
+            yield batch
+
+def cell(row: List[str], i: Optional[int]) -> str:
+    return row[i] if i is not None and i < len(row) else ""
+
+def row_key(row: List[str], idx: Dict[str, Optional[int]], i: int) -> str:
+    """Checkpoint key for a row: its Jira issue key, or its 1-based row number if the export has none."""
+    return cell(row, idx["issue key"]).strip() or f"row:{i}"
+
+def load_checkpoint(path: str, target: Dict[str, str]) -> set:
+    """Return the row keys a previous run recorded for target; a truncated last line is ignored.
+
+    Records for another base_url/ws_slug/project_id are skipped so one CSV can be imported into
+    several projects. Records without these fields predate them and are trusted as-is.
+    """
+    seen = set()
+    other = 0
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    rec = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if any(k in rec and rec[k] != v for k, v in target.items()):
+                    other += 1
+                    continue
+                seen.add(rec.get("jira_key") or f"row:{rec.get('row')}")
+    except FileNotFoundError:
+        pass
+    if other:
+        print(f"[WARN] Ignoring {other} checkpoint records for a different workspace/project in {path}")
+    return seen
+
+def build_payload(row: List[str], idx: Dict[str, Optional[int]], label_cache: CaseInsensitiveIndex,
+                  state_cache: CaseInsensitiveIndex, label_sep: str = DEFAULT_LABEL_SEP) -> Tuple[Optional[dict], List[str], Optional[str]]:
+    """Map one CSV row to an issue payload in a single pass.
+
+    Returns (payload, label names missing from label_cache, state name missing from state_cache).
+    payload is None when the row has no Summary.
+    """
+    name = cell(row, idx["summary"]).strip()
+    if not name:
+        return None, [], None
+
+    payload = {"name": name}
+    description = cell(row, idx["description"])
+    if description:
+        payload["description"] = description
+    jira_priority = cell(row, idx["priority"])
+    priority = _priority_get(jira_priority.strip()) if jira_priority else None
+    if priority:
+        payload["priority"] = priority  # Plane accepts strings like "high" per UI; adjust if your instance differs.
+
+    missing_state = None
+    jira_status = cell(row, idx["status"])
+    target_state_name = _state_get(jira_status.strip()) if jira_status else None
+    if target_state_name:
+        state_obj = state_cache.mapping().get(target_state_name.lower())
+        if state_obj and state_obj.get("id"):
+            payload["state_id"] = state_obj["id"]
+        else:
+            missing_state = target_state_name
+
+    # parse_labels already strips, so only lowercasing is left per label
+    missing_labels: List[str] = []
+    labels = parse_labels(cell(row, idx["labels"]), sep=label_sep)
+    if labels:
+        lc_get = label_cache.mapping().get
+        label_ids: List[str] = []
+        for lbl in labels:
+            lbl_obj = lc_get(lbl.lower())
+            if lbl_obj and lbl_obj.get("id"):
+                label_ids.append(lbl_obj["id"])
+            else:
+                missing_labels.append(lbl)
+        if label_ids:
+            payload["label_ids"] = label_ids
+    return payload, missing_labels, missing_state
+
 # --------------------------
 # Main
 # --------------------------
 
+_UUID_RE = re.compile(r"^[0-9a-f-]{8,}$")
+
 
 def resolve_project_id(base_url: str, ws_slug: str, headers: Dict[str,str], want: str) -> str:
     """Resolve a project by id, identifier, slug, or name via List Projects. Return id."""
-    url = f"{base_url}/api/v1/workspaces/{ws_slug}/projects/"
-    data = get(url, headers)
-    results = data.get("results", data)
     want_norm = (want or "").strip().lower()
     # If want already looks like a UUID, just return it
-    import re as _re
-    if _re.match(r"^[0-9a-f-]{8,}$", want_norm):
+    if _UUID_RE.match(want_norm):
         return want
-    # Match by identifier, name, or slug (case-insensitive)
-    for proj in results:
-        pid = proj.get("id") or proj.get("project_id")
-        ident = (proj.get("identifier") or "").strip().lower()
-        name = (proj.get("name") or "").strip().lower()
-        slug = (proj.get("slug") or "").strip().lower()
-        if want_norm in (ident, name, slug):
-            if pid:
-                return pid
+    pid = _project_index(base_url, ws_slug, tuple(sorted(headers.items()))).get(want_norm)
+    if pid:
+        return pid
     raise RuntimeError(f"Could not resolve project '{want}' in workspace '{ws_slug}'.")
 
+@functools.lru_cache(maxsize=32)
+def _project_index(base_url: str, ws_slug: str, header_items: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    """Map the lowercased id, identifier, name and slug of every project in the workspace to its id."""
+    url = f"{base_url}/api/v1/workspaces/{ws_slug}/projects/"
+    data = get(url, dict(header_items))
+    index: Dict[str, str] = {}
+    for proj in data.get("results", data):
+        pid = proj.get("id") or proj.get("project_id")
+        if not pid:
+            continue
+        for key in (proj.get("identifier"), proj.get("name"), proj.get("slug"), pid):
+            norm = (key or "").strip().lower()
+            if norm:
+                index.setdefault(norm, pid)  # first project listed wins, as with the old linear scan
+    return index
+
+async def run_import(args, base_url: str, ws_slug: str, project_id: str, headers: Dict[str,str],
+                     lookups: ProjectLookups, checkpoint: Optional[BinaryIO]) -> Tuple[int, int, int]:
+    """Create missing labels/states in bulk, then stream issues to concurrent workers. Returns (created, skipped, failures).
+
+    checkpoint is the open --checkpoint file, or None for a dry run.
+    """
+    label_cache = lookups.labels
+    state_cache = lookups.states
+    created_count = 0
+    skipped = 0
+    failures = 0
+
+    header = read_csv_header(args.csv, args.delimiter)
+    required_cols = ["Summary"]
+    for col in required_cols:
+        if col not in header:
+            print(f"[FATAL] CSV missing required column: {col}. Present: {header}", file=sys.stderr)
+            sys.exit(2)
+    idx = csv_column_indices(header)
+
+    target = {"base_url": base_url, "ws_slug": ws_slug, "project_id": project_id}
+    seen = load_checkpoint(args.checkpoint, target)
+    if seen:
+        print(f"[RESUME] {len(seen)} issues already imported according to {args.checkpoint}")
+
+    # Pass 1: stream the CSV collecting every label/state it references that Plane lacks, keyed case-insensitively
+    needed_labels: Dict[str, str] = {}
+    needed_states: Dict[str, str] = {}
+    i = 0
+    for batch in iter_csv_batches(args.csv, args.delimiter, args.batch_size):
+        for row in batch:
+            i += 1
+            if seen and row_key(row, idx, i) in seen:
+                continue
+            _, row_missing_labels, row_missing_state = build_payload(row, idx, label_cache, state_cache, args.label_sep)
+            for lbl in row_missing_labels:
+                needed_labels.setdefault(lbl.lower(), lbl)
+            if row_missing_state:
+                needed_states.setdefault(row_missing_state.lower(), row_missing_state)
+    # Re-list disk-cached labels/states once before treating a miss as "create it"
+    if needed_labels and lookups.refresh("labels"):
+        needed_labels = {k: n for k, n in needed_labels.items() if k not in label_cache}
+    if needed_states and lookups.refresh("states"):
+        needed_states = {k: n for k, n in needed_states.items() if k not in state_cache}
+    missing_labels = [] if args.no_create_labels else list(needed_labels.values())
+    missing_states = [] if args.no_create_states else list(needed_states.values())
+
+    sem = asyncio.Semaphore(args.concurrency)
+    # One-token bucket refilled every 1/max_rps seconds: a smooth rate with no start-up burst
+    limiter = AsyncLimiter(1, 1 / args.max_rps) if args.max_rps else None
+
+    limits = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+    async with httpx.AsyncClient(http2=True, headers=headers, limits=limits, timeout=30) as client:
+
+        async def create_missing(kind: str, names: List[str], ensure, cache: MutableMapping[str, dict]) -> int:
+            """Create each missing label/state; returns how many creates failed."""
+            async def one(name: str) -> bool:
+                async with sem:
+                    try:
+                        await ensure(client, base_url, ws_slug, project_id, name, cache, limiter)
+                        lookups.save()  # write through, so a killed run never re-creates it
+                        print(f"[OK] Created {kind}: {name}")
+                        return True
+                    except Exception as e:
+                        print(f"[FAIL] Create {kind} {name}: {e}", file=sys.stderr)
+                        return False
+            results = await asyncio.gather(*(one(n) for n in names))
+            return len(results) - sum(results)
+
+        # Pass 2: create everything missing up front so issue creation never waits on it
+        if args.dry_run or args.offline:
+            for n in missing_states:
+                print(f"[DRY] Would create state: {n}")
+            for n in missing_labels:
+                print(f"[DRY] Would create label: {n}")
+        else:
+            # Counted as failures: issues referencing these are still imported, just without the label/state
+            failures += sum(await asyncio.gather(
+                create_missing("state", missing_states, ensure_state_async, state_cache),
+                create_missing("label", missing_labels, ensure_label_async, label_cache),
+            ))
+
+        url = issues_url(base_url, ws_slug, project_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=ISSUE_QUEUE_SIZE)
+        loop = asyncio.get_running_loop()
+
+        def produce() -> Tuple[int, int]:
+            """Runs in a thread: stream the CSV, build payloads and feed them to the workers.
+
+            Returns (dry-run count, skipped count); the workers keep their own counters.
+            """
+            planned = 0
+            skipped_rows = 0
+            i = 0
+            for batch in iter_csv_batches(args.csv, args.delimiter, args.batch_size):
+                for row in batch:
+                    if stop.is_set():
+                        return planned, skipped_rows
+                    i += 1
+                    key = row_key(row, idx, i)
+                    if key in seen:
+                        print(f"[SKIP] Row {i}: {key} already imported")
+                        skipped_rows += 1
+                        continue
+                    payload, _, _ = build_payload(row, idx, label_cache, state_cache, args.label_sep)
+                    if payload is None:
+                        print(f"[SKIP] Row {i}: empty Summary")
+                        skipped_rows += 1
+                        continue
+
+                    if args.dry_run or args.offline:
+                        print(f"[DRY] Row {i}: would create issue payload={payload}")
+                        planned += 1
+                        continue
+
+                    # Blocks this thread while the queue is full, so parsing never runs far ahead of the network
+                    asyncio.run_coroutine_threadsafe(queue.put((i, key, payload)), loop).result()
+            return planned, skipped_rows
+
+        async def worker() -> None:
+            nonlocal created_count, failures
+            while (item := await queue.get()) is not None:
+                if stop.is_set():
+                    continue  # keep draining so the producer never blocks on a full queue
+                i, key, payload = item
+                try:
+                    resp = await create_issue_async(client, url, payload, limiter)
+                    created_count += 1
+                    print(f"[OK] Row {i}: created issue -> {resp.get('id') or resp}")
+                    done.put_nowait({**target, "row": i, "jira_key": key, "plane_id": resp.get("id")})
+                except Exception as e:
+                    failures += 1
+                    print(f"[FAIL] Row {i}: {e}", file=sys.stderr)
+
+        done: asyncio.Queue = asyncio.Queue()
+        # Set if the checkpoint writer dies: issues it can no longer record must not be created
+        stop = threading.Event()
+
+        async def write_checkpoints() -> None:
+            """Single writer, so concurrent workers never interleave checkpoint lines."""
+            while (rec := await done.get()) is not None:
+                checkpoint.write(orjson.dumps(rec) + b"\n")
+                checkpoint.flush()
+
+        def on_writer_exit(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                stop.set()
+
+        # Pass 3: a reader thread builds payloads from the now-complete caches while
+        # --concurrency workers POST them, overlapping CSV parsing with network time
+        writer = None
+        if checkpoint is not None:
+            writer = asyncio.create_task(write_checkpoints())
+            writer.add_done_callback(on_writer_exit)
+        workers = [asyncio.create_task(worker()) for _ in range(args.concurrency)]
+        try:
+            planned, skipped = await asyncio.to_thread(produce)
+        finally:
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+            if writer is not None:
+                done.put_nowait(None)
+                await asyncio.gather(writer, return_exceptions=True)
+        if stop.is_set():
+            print(f"[FATAL] Writing checkpoint {args.checkpoint} failed ({writer.exception()}); stopped after "
+                  f"creating {created_count} issues, the last of which may be missing from it", file=sys.stderr)
+            sys.exit(1)
+        created_count += planned
+
+    return created_count, skipped, failures
+
+
+MIN_RPS = 1 / 60  # one request a minute; anything slower is almost certainly a typo
+
+def rate_arg(value: str) -> float:
+    rate = float(value)
+    # nan compares False against everything and inf would make the refill interval zero
+    if not math.isfinite(rate) or rate < MIN_RPS:
+        raise argparse.ArgumentTypeError(f"must be a finite number of at least {MIN_RPS:.4g} requests/second, got {value}")
+    return rate
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return n
+
 
 def main():
     parser = argparse.ArgumentParser(description="Import Jira CSV into Plane")
@@ -209,114 +733,60 @@ def main():
     parser.add_argument("--offline", action="store_true", help="Do not call Plane at all (skip label/state fetch and creation)")
     parser.add_argument("--no-create-labels", action="store_true", help="Do not auto-create missing labels")
     parser.add_argument("--no-create-states", action="store_true", help="Do not auto-create missing states")
-    parser.add_argument("--rate-limit", type=float, default=0.0, help="Seconds to sleep between issue creates to be gentle (e.g. 0.5)")
+    parser.add_argument("--max-rps", type=rate_arg, help=f"Max creates per second, at least {MIN_RPS:.4g}; unlimited if omitted (Plane's default API limit is 60/min, i.e. 1)")
+    parser.add_argument("--concurrency", type=positive_int, default=32, help="Max creates in flight at once, i.e. issue worker count (default 32)")
+    parser.add_argument("--batch-size", type=positive_int, default=DEFAULT_BATCH_SIZE, help=f"CSV rows read from disk per batch (default {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--checkpoint", help="JSONL file recording created issues, used to resume (default <csv>.checkpoint.jsonl)")
+    parser.add_argument("--cache-file", default=DEFAULT_CACHE_FILE, help=f"Project/label/state lookup cache (default {DEFAULT_CACHE_FILE})")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached lookups and refetch from Plane")
     args = parser.parse_args()
+    if not args.checkpoint:
+        args.checkpoint = f"{args.csv}.checkpoint.jsonl"
 
     load_dotenv()  # read .env
 
     base_url = env("PLANE_BASE_URL")  # e.g. https://plane.yourdomain.com or https://api.plane.so
     ws_slug = env("PLANE_WORKSPACE_SLUG")  # workspace slug
     project_id = env("PLANE_PROJECT_ID")   # May be id, identifier, slug, or name; we will resolve
-    # Attempt to resolve friendly names to an id via List Projects
-    try:
-        project_id = resolve_project_id(base_url, ws_slug, headers, project_id)
-    except Exception as e:
-        print(f"[WARN] Project resolution failed ({e}). Will try using it as-is.")
-
     api_key = env("PLANE_API_KEY")         # X-API-Key token
 
     headers = plane_headers(api_key)
 
-    # cache lookups
-    label_cache = list_labels(base_url, ws_slug, project_id, headers)
-    state_cache = list_states(base_url, ws_slug, project_id, headers)
-
-    created_count = 0
-    skipped = 0
-    failures = 0
-
-    with open(args.csv, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=args.delimiter)
-        required_cols = ["Summary"]
-        for col in required_cols:
-            if col not in reader.fieldnames:
-                print(f"[FATAL] CSV missing required column: {col}. Present: {reader.fieldnames}", file=sys.stderr)
-                sys.exit(2)
-
-        for i, row in enumerate(reader, start=1):
-            name = (row.get("Summary") or "").strip()
-            if not name:
-                print(f"[SKIP] Row {i}: empty Summary")
-                skipped += 1
-                continue
-
-            description = row.get("Description") or ""
-            jira_labels_raw = row.get("Labels") or row.get("labels") or ""
-            jira_status = row.get("Status") or row.get("status") or ""
-            jira_priority = row.get("Priority") or row.get("priority") or ""
-
-            labels = parse_labels(jira_labels_raw, sep=args.label_sep)
-            target_state_name = map_state(jira_status)
-            priority = map_priority(jira_priority)
-
-            payload = {"name": name}
-            if description:
-                payload["description"] = description
-            if priority:
-                payload["priority"] = priority  # Plane accepts strings like "high" per UI; adjust if your instance differs.
-            # Resolve/ensure state id if we have a target state
-            if target_state_name:
-                state_key = target_state_name.strip().lower()
-                state_obj = state_cache.get(state_key)
-                if not state_obj and not args.no_create_states:
-                    if args.dry_run or args.offline:
-                        print(f"[DRY] Would create state: {target_state_name}")
-                        state_obj = {"name": target_state_name, "id": None}
-                    else:
-                        if args.offline:
-                            print(f"[OFFLINE] Skipping create state: {target_state_name}")
-                            state_obj = {"name": target_state_name, "id": None}
-                        else:
-                            state_obj = ensure_state(base_url, ws_slug, project_id, headers, target_state_name)
-                            state_cache = list_states(base_url, ws_slug, project_id, headers)
-                if state_obj and state_obj.get("id"):
-                    payload["state_id"] = state_obj["id"]
-
-            # Resolve/ensure labels
-            label_ids: List[str] = []
-            for lbl in labels:
-                key = lbl.strip().lower()
-                lbl_obj = label_cache.get(key)
-                if not lbl_obj and not args.no_create_labels:
-                    if args.dry_run or args.offline:
-                        print(f"[DRY] Would create label: {lbl}")
-                        lbl_obj = {"name": lbl, "id": None}
-                    else:
-                        if args.offline:
-                            print(f"[OFFLINE] Skipping create label: {lbl}")
-                            lbl_obj = {"name": lbl, "id": None}
-                        else:
-                            lbl_obj = ensure_label(base_url, ws_slug, project_id, headers, lbl)
-                            label_cache = list_labels(base_url, ws_slug, project_id, headers)
-                if lbl_obj and lbl_obj.get("id"):
-                    label_ids.append(lbl_obj["id"])
-            if label_ids:
-                payload["label_ids"] = label_ids
-
-            if args.dry_run or args.offline:
-                print(f"[DRY] Row {i}: would create issue payload={payload}")
-                created_count += 1
-                continue
+    # Loaded even with --refresh-cache: the file is shared, and saving must keep other projects' entries
+    disk_cache = load_disk_cache(args.cache_file)
+    # Attempt to resolve friendly names to an id via List Projects
+    project_key = f"{base_url}|{ws_slug}|{project_id}"
+    cached = None if args.refresh_cache else cache_get(disk_cache, "projects", project_key)
+    if cached:
+        project_id = cached[0]
+    else:
+        try:
+            project_id = resolve_project_id(base_url, ws_slug, headers, project_id)
+            cache_put(disk_cache, "projects", project_key, project_id)
+        except (RuntimeError, requests.RequestException) as e:
+            print(f"[WARN] Project resolution failed ({e}). Will try using it as-is.")
+
+    # cache lookups, from disk when fresh
+    lookups = ProjectLookups(args.cache_file, disk_cache, base_url, ws_slug, project_id, headers,
+                             refresh=args.refresh_cache)
+
+    # Opened before anything is created, so a bad --checkpoint path fails before the first POST
+    checkpoint = None
+    if not (args.dry_run or args.offline):
+        try:
+            checkpoint = open(args.checkpoint, "ab")
+        except OSError as e:
+            print(f"[FATAL] Cannot open checkpoint {args.checkpoint}: {e}", file=sys.stderr)
+            sys.exit(2)
 
-            try:
-                resp = create_issue(base_url, ws_slug, project_id, headers, payload)
-                created_count += 1
-                print(f"[OK] Row {i}: created issue -> {resp.get('id') or resp}")
-                if args.rate_limit > 0:
-                    time.sleep(args.rate_limit)
-            except Exception as e:
-                failures += 1
-                print(f"[FAIL] Row {i}: {e}", file=sys.stderr)
+    try:
+        created_count, skipped, failures = asyncio.run(
+            run_import(args, base_url, ws_slug, project_id, headers, lookups, checkpoint)
+        )
+    finally:
+        lookups.save()
+        if checkpoint is not None:
+            checkpoint.close()
 
     print(f"\nDone. Created: {created_count}, Skipped: {skipped}, Failures: {failures}")
 